@@ -154,7 +154,7 @@ def insert_country_data(target, connection, **kwargs):
     df = df.reindex(columns=columns).rename(columns=columns)
     for column in ("ldc", "lldc", "sids"):
         df[column] = df[column].eq("x")
-    df.sort_values("id", ignore_index=True, inplace=True)
+    df = df.sort_values("id", ignore_index=True)
     df.to_sql(
         "country", con=connection, if_exists="append", index=False, method="multi"
     )
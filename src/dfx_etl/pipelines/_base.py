@@ -6,9 +6,10 @@ classes by inheriting from the base classes defined below.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
-from typing import final
+from typing import Any, Callable, Iterable, final
 from urllib.parse import urlparse
 
 import httpx
@@ -23,9 +24,10 @@ from pydantic import (
     HttpUrl,
     ValidationError,
 )
+from tqdm import tqdm
 
 from ..settings import SETTINGS
-from ..utils import get_country_metadata
+from ..utils import _read_csv, get_country_metadata
 from ..validation import DataSchema, MetadataSchema
 
 __all__ = ["BaseRetriever", "BaseTransformer"]
@@ -129,6 +131,33 @@ class BaseRetriever(BaseModel, ABC):
         """
         return self._get_metadata()
 
+    @final
+    def map_concurrently(
+        self, func: Callable[[Any], pd.DataFrame | None], values: Iterable
+    ) -> list[pd.DataFrame | None]:
+        """
+        Apply a function to each value concurrently using a pool of threads.
+
+        Retrieval from remote sources is I/O-bound, so requests for different indicators
+        can be made in parallel. The number of threads is controlled by
+        `SETTINGS.pipeline.max_workers`.
+
+        Parameters
+        ----------
+        func : Callable[[Any], pd.DataFrame | None]
+            Function to apply to each value, typically a wrapper around `_get_data`.
+        values : Iterable
+            Values to apply the function to, such as indicator codes.
+
+        Returns
+        -------
+        list[pd.DataFrame | None]
+            Results in the same order as `values`.
+        """
+        values = list(values)
+        with ThreadPoolExecutor(max_workers=SETTINGS.pipeline.max_workers) as executor:
+            return list(tqdm(executor.map(func, values), total=len(values)))
+
     @final
     def read_csv(
         self,
@@ -141,7 +170,10 @@ class BaseRetriever(BaseModel, ABC):
         Read a CSV file from a remote location using an HTTP GET request.
 
         This method may be more efficient than using `pd.read_csv` directly when a custom client
-        is provided and when the method is repeatedly invoked in a loop.
+        is provided and when the method is repeatedly invoked in a loop. The content is parsed
+        with the multithreaded PyArrow engine, falling back to the C engine for quoted values
+        spanning multiple lines, and columns are backed by PyArrow by default so that those
+        untouched by a transformer are never converted to NumPy-backed objects.
 
         Parameters
         ----------
@@ -153,7 +185,8 @@ class BaseRetriever(BaseModel, ABC):
         client: httpx.Client, optional
             Client to use to make a request.
         **kwargs
-            Extra arguments to be passed to `pd.read_csv`.
+            Extra arguments to be passed to `pd.read_csv`. Pass `dtype_backend="numpy_nullable"`
+            to override the default PyArrow backend.
 
         Returns
         -------
@@ -172,7 +205,8 @@ class BaseRetriever(BaseModel, ABC):
         except httpx.HTTPStatusError as error:
             print(error)
             return None
-        return pd.read_csv(BytesIO(response.content), low_memory=False, **kwargs)
+        kwargs = {"dtype_backend": "pyarrow"} | kwargs
+        return _read_csv(BytesIO(response.content), **kwargs)
 
 
 class BaseTransformer(BaseModel, ABC):
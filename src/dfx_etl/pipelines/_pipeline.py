@@ -102,7 +102,7 @@ class Pipeline(BaseModel):
                 "year_max": SETTINGS.pipeline.year_max,
             },
         ).reset_index(drop=True)
-        df.name = self.retriever.provider
+        df.attrs["name"] = self.retriever.provider
         self._df_transformed = df
         return self
 
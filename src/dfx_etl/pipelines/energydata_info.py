@@ -3,10 +3,10 @@ ETL routines for data from ENERGYDATA.INFO.
 See https://energydata.info.
 """
 
-import country_converter as coco
 import pandas as pd
 from pydantic import Field, HttpUrl
 
+from ..utils import convert_country_names
 from ..validation import PREFIX_DIMENSION
 from ._base import BaseRetriever, BaseTransformer
 
@@ -40,7 +40,14 @@ class Retriever(BaseRetriever):
         pd.DataFrame
             Raw data from the API for the indicators with supported disaggregations.
         """
-        return pd.read_excel(str(self.uri), header=1, na_values=[".."], **kwargs)
+        return pd.read_excel(
+            str(self.uri),
+            header=1,
+            na_values=[".."],
+            engine="calamine",
+            dtype_backend="pyarrow",
+            **kwargs,
+        )
 
 
 class Transformer(BaseTransformer):
@@ -62,25 +69,22 @@ class Transformer(BaseTransformer):
         pd.DataFrame
             Standardised data frame.
         """
-        cc = coco.CountryConverter()
         df = df.copy()
-        df.columns = [
+        labels = [
             "country",
             PREFIX_DIMENSION + "energy_technology",
             PREFIX_DIMENSION + "grid_connection",
-            "year",
-            "value",
         ]
-        df.ffill(inplace=True)
-        df["country_code"] = cc.pandas_convert(df["country"], to="ISO3")
-        df.drop(columns=["country"], inplace=True)
-        df = df[df["country_code"] != "not found"].reset_index(drop=True)
+        df.columns = labels + ["year", "value"]
+        # Fill merged label cells only, so that missing values are not carried over
+        df[labels] = df[labels].ffill()
+        df["country_code"] = convert_country_names(df["country"])
+        df = df.drop(columns=["country"]).dropna(subset=["country_code"])
         df["indicator_name"] = (
             "Installed electricity capacity by country/area (MW) by Country/area, Technology, "
             "Grid connection and Year [ELECCAP]"
         )
         # remove rows without values
-        df.dropna(subset=["value"], inplace=True)
+        df = df.dropna(subset=["value"])
         # only remove full duplicates
-        df.drop_duplicates(ignore_index=True, inplace=True)
-        return df
+        return df.drop_duplicates(ignore_index=True)
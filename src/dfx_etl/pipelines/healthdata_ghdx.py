@@ -5,11 +5,11 @@ See https://www.healthdata.org.
 
 from pathlib import Path
 
-import country_converter as coco
 import pandas as pd
 from pydantic import Field
 
 from ..storage import BaseStorage
+from ..utils import convert_country_names
 from ..validation import PREFIX_DIMENSION, SexEnum
 from ._base import BaseRetriever, BaseTransformer
 
@@ -45,6 +45,18 @@ class Retriever(BaseRetriever):
         pd.DataFrame
             Raw data from the API for the indicators with supported disaggregations.
         """
+        # Skip ID and uncertainty interval columns that are not used downstream
+        columns = [
+            "measure_name",
+            "location_name",
+            "sex_name",
+            "age_name",
+            "cause_name",
+            "metric_name",
+            "year",
+            "val",
+        ]
+        kwargs = {"usecols": columns} | kwargs
         return storage.read_dataset(self.uri, **kwargs)
 
 
@@ -67,11 +79,10 @@ class Transformer(BaseTransformer):
         pd.DataFrame
             Standardised data frame.
         """
-        cc = coco.CountryConverter()
-        df["country_code"] = cc.pandas_convert(df["location_name"], to="ISO3")
+        df["country_code"] = convert_country_names(df["location_name"])
         # construct indicator names and derive indicator codes
-        df["indicator_name"] = df.apply(
-            lambda row: f"{row.metric_name} of {row.measure_name}", axis=1
+        df["indicator_name"] = (
+            df["metric_name"].astype(str) + " of " + df["measure_name"].astype(str)
         )
         # recode sex columns
         mapping = {
@@ -89,5 +100,4 @@ class Transformer(BaseTransformer):
             "age_name": PREFIX_DIMENSION + "age",
             "cause_name": PREFIX_DIMENSION + "cause",
         }
-        df.rename(columns=mapping, inplace=True)
-        return df
+        return df.rename(columns=mapping)
@@ -4,13 +4,13 @@ See https://ilostat.ilo.org/resources/sdmx-tools/.
 """
 
 import xml.etree.ElementTree as ET
-from io import StringIO
+from functools import cache
+from io import BytesIO
 from urllib.parse import urljoin
 
 import httpx
 import pandas as pd
 from pydantic import Field, HttpUrl
-from tqdm import tqdm
 
 from ..validation import PREFIX_DIMENSION
 from ._base import BaseRetriever, BaseTransformer
@@ -21,10 +21,14 @@ BASE_URL = "https://sdmx.ilo.org/rest/"
 DIMENSIONS = {"SEX", "AGE", "GEO", "EDU", "NOC"}
 
 
+@cache
 def _get_codelist_mapping(name: str) -> dict:
     """
     Get codelist mapping from IDs to names from the ILO SDMX API codelist endpoint.
 
+    Codelists are static, so responses are cached for the lifetime of the process
+    to avoid refetching them on every transformation.
+
     Parameters
     ----------
     name : str
@@ -37,13 +41,12 @@ def _get_codelist_mapping(name: str) -> dict:
     """
     response = httpx.get(urljoin(BASE_URL, f"codelist/ILO/CL_{name}"), timeout=10)
     response.raise_for_status()
-    # create a file-like object to extract namespace
-    xml = StringIO(response.text)
-    namespaces = dict([node for _, node in ET.iterparse(xml, events=["start-ns"])])
+    # parse the raw bytes once, collecting namespaces along the way
+    parser = ET.iterparse(BytesIO(response.content), events=["start-ns"])
+    namespaces = dict([node for _, node in parser])
     # add the XML namespace for xml:lang
     namespaces["xml"] = "http://www.w3.org/XML/1998/namespace"
-    # parse the XML
-    root = ET.fromstring(response.text)
+    root = parser.root
     return {
         element.get("id"): element.find("common:Name[@xml:lang='en']", namespaces).text
         for element in root.findall(".//structure:Code", namespaces)
@@ -74,21 +77,21 @@ class Retriever(BaseRetriever):
         df_metadata = self.get_metadata()
         # indicator codes contain disaggregations, e.g., SDG_0852_SEX_AGE_RT
         # subset only some disaggregations and no classification (NOC)
-        mask = (
-            df_metadata["code"]
-            .str.split("_")
-            .str.slice(2, -1)
-            .apply(lambda x: not set(x) - DIMENSIONS)
-        )
+        parts = df_metadata["code"].str.split("_").str.slice(2, -1).explode()
+        # codes without disaggregations explode to a single missing value
+        mask = (parts.isin(DIMENSIONS) | parts.isna()).groupby(level=0).all()
         df_metadata = df_metadata.loc[mask].reset_index(drop=True)
-        data = []
         with self.client as client:
-            for _, row in tqdm(df_metadata.iterrows(), total=len(df_metadata)):
-                df = self._get_data(row.code, client=client, **kwargs)
-                if df is None:
-                    continue
-                df["indicator_name"] = f"{row['name']} [{row['code']}]"
-                data.append(df)
+            dfs = self.map_concurrently(
+                lambda code: self._get_data(code, client=client, **kwargs),
+                df_metadata["code"],
+            )
+        data = []
+        for row, df in zip(df_metadata.itertuples(index=False), dfs):
+            if df is None:
+                continue
+            df["indicator_name"] = f"{row.name} [{row.code}]"
+            data.append(df)
         return pd.concat(data, axis=0, ignore_index=True)
 
     def _get_metadata(self) -> pd.DataFrame:
@@ -174,13 +177,14 @@ class Transformer(BaseTransformer):
         }
 
         # subset annual indicators
-        df = df.query("FREQ == 'A'").copy()
+        mask = df["FREQ"].eq("A").fillna(False)
 
         # keep only aggregate to avoid overlaps between aggregate, 5- and 10-year bands
         # and different classifications for education too
         for column in ("AGE", "EDU"):
             if column in df.columns:
-                df = df.loc[df[column].str.contains("AGGREGATE", na=True)].copy()
+                mask &= df[column].str.contains("AGGREGATE", na=True)
+        df = df.loc[mask].copy()
 
         # replace dimension codes with labels
         mapping = {
@@ -193,5 +197,4 @@ class Transformer(BaseTransformer):
 
         # reindex and rename columns
         df = df.reindex(columns=columns).rename(columns=columns)
-        df.dropna(subset=["value"], inplace=True)
-        return df
+        return df.dropna(subset=["value"])
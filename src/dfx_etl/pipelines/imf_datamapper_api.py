@@ -4,9 +4,9 @@ See https://www.imf.org/external/datamapper/api/help.
 """
 
 import httpx
+import orjson
 import pandas as pd
 from pydantic import Field, HttpUrl
-from tqdm import tqdm
 
 from ._base import BaseRetriever, BaseTransformer
 
@@ -39,14 +39,17 @@ class Retriever(BaseRetriever):
             Raw data from the API for the indicators with supported disaggregations.
         """
         df_metadata = self.get_metadata()
-        data = []
         with self.client as client:
-            for _, row in tqdm(df_metadata.iterrows(), total=len(df_metadata)):
-                df = self._get_data(row.code, client=client, **kwargs)
-                if df is None:
-                    continue
-                df["indicator_name"] = f"{row['name']}, {row['unit']} [{row['code']}]"
-                data.append(df)
+            dfs = self.map_concurrently(
+                lambda code: self._get_data(code, client=client, **kwargs),
+                df_metadata["code"],
+            )
+        data = []
+        for row, df in zip(df_metadata.itertuples(index=False), dfs):
+            if df is None:
+                continue
+            df["indicator_name"] = f"{row.name}, {row.unit} [{row.code}]"
+            data.append(df)
         return pd.concat(data, axis=0, ignore_index=True)
 
     def _get_metadata(self) -> pd.DataFrame:
@@ -60,7 +63,7 @@ class Retriever(BaseRetriever):
         """
         response = self.client.get("indicators")
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         data = [
             {"series_id": series_id} | metadata
             for series_id, metadata in data["indicators"].items()
@@ -101,15 +104,16 @@ class Retriever(BaseRetriever):
             raise ValueError("`client` must include a `base_url`.")
         response = client.get(indicator_code, params=params)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         if (values := data.get("values")) is None:
             return None
-        dfs = []
-        for country_code, records in values[indicator_code].items():
-            df = pd.DataFrame(records.items(), columns=["year", "value"])
-            df["country_code"] = country_code
-            dfs.append(df)
-        return pd.concat(dfs, axis=0, ignore_index=True)
+        # Flatten records once instead of concatenating a small frame per country
+        data = [
+            (year, value, country_code)
+            for country_code, records in values[indicator_code].items()
+            for year, value in records.items()
+        ]
+        return pd.DataFrame(data, columns=["year", "value", "country_code"])
 
 
 class Transformer(BaseTransformer):
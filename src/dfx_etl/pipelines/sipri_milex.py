@@ -4,11 +4,11 @@ by Stockholm International Peace Research Institute (SIPRI).
 See https://www.sipri.org/databases/milex.
 """
 
-import country_converter as coco
 import pandas as pd
 from pydantic import Field, HttpUrl
 from tqdm import tqdm
 
+from ..utils import convert_country_names
 from ._base import BaseRetriever, BaseTransformer
 
 __all__ = ["Retriever", "Transformer"]
@@ -44,12 +44,14 @@ class Retriever(BaseRetriever):
             Raw data from the API for the indicators with supported disaggregations.
         """
         data = []
-        for sheet_name, indicator_name in tqdm(self.metadata.items()):
-            df = self._get_data(sheet_name)
-            if df is None:
-                continue
-            df["indicator_name"] = indicator_name
-            data.append(df)
+        # download and open the workbook once for all sheets
+        with pd.ExcelFile(str(self.uri), engine="calamine") as xlsx:
+            for sheet_name, indicator_name in tqdm(self.metadata.items()):
+                df = self._get_data(xlsx, sheet_name)
+                if df is None:
+                    continue
+                df["indicator_name"] = indicator_name
+                data.append(df)
         return pd.concat(data, axis=0, ignore_index=True)
 
     @property
@@ -70,12 +72,14 @@ class Retriever(BaseRetriever):
             "Share of Govt. spending": "Military expenditure as a percentage of general government expenditure, 1988-2024 only [SIPRI_MILEXT_SHARE_OF_GOV_SPENDING]",
         }
 
-    def _get_data(self, sheet_name: str) -> pd.DataFrame:
+    def _get_data(self, xlsx: pd.ExcelFile, sheet_name: str) -> pd.DataFrame:
         """
         Get series data from the the SIPRI Military Expenditure Database.
 
         Parameters
         ----------
+        xlsx : pd.ExcelFile
+            Opened Excel file to parse the sheet from.
         sheet_name : str
             Sheet name to read from the Excel file. See `metadata`.
 
@@ -84,12 +88,14 @@ class Retriever(BaseRetriever):
         pd.DataFrame
             Data frame with country data in the wide format.
         """
-        # infer the header row
-        xlsx = pd.ExcelFile(str(self.uri))
-        df = xlsx.parse(sheet_name=sheet_name)
-        header = df.iloc[:, 0].eq("Country").idxmax() + 1
+        # infer the header row from the first column only
+        column = xlsx.parse(sheet_name=sheet_name, header=None, usecols=[0]).iloc[:, 0]
+        header = column.eq("Country").idxmax()
         return xlsx.parse(
-            sheet_name=sheet_name, header=header, na_values=["xxx", "..."]
+            sheet_name=sheet_name,
+            header=header,
+            na_values=["xxx", "..."],
+            dtype_backend="pyarrow",
         )
 
 
@@ -115,14 +121,12 @@ class Transformer(BaseTransformer):
 
         # Subset only relevant columns
         columns = ["Country", "indicator_name"]
-        df = df[columns].join(df.filter(regex=r"\d+"))
+        df = df[columns + df.filter(regex=r"\d+").columns.tolist()]
         # Reshape from wide to long
         df = df.melt(id_vars=columns, var_name="year", value_name="value")
         # Remove missing values
-        df = df.dropna(ignore_index=True)
+        df = df.dropna()
         # Infer country ISO alpha-3 codes from names
-        cc = coco.CountryConverter()
-        df["country_code"] = cc.pandas_convert(df["Country"], to="ISO3", not_found=None)
-        df = df.dropna(subset="country_code")
-        df = df.drop(columns=["Country"])
-        return df.reset_index(drop=True)
+        df["country_code"] = convert_country_names(df["Country"])
+        df = df.dropna(subset="country_code", ignore_index=True)
+        return df.drop(columns=["Country"])
@@ -44,6 +44,17 @@ class Retriever(BaseRetriever):
         pd.DataFrame
             Raw data frame with data from the dashboard.
         """
+        # Only parse the columns used downstream by the transformer
+        columns = [
+            "Indicator",
+            "Unit",
+            "Subgroup",
+            "Area ID",
+            "Time Period",
+            "Data value",
+            "Source",
+        ]
+        kwargs = {"usecols": columns} | kwargs
         return storage.read_dataset(self.uri, **kwargs)
 
 
@@ -74,21 +85,21 @@ class Transformer(BaseTransformer):
             "Source": "source",
         }
         # remove unspecified disaggregations
-        df = df.loc[~df["Subgroup"].str.startswith("Category")].copy()
-        # only keep indicators with just one or 'Total' dimension
-        df["n_subgroups"] = df.groupby("Indicator")["Subgroup"].transform("nunique")
-        df = df.loc[df["n_subgroups"].eq(1) | df["Subgroup"].eq("Total")].copy()
-        df["indicator_name"] = df.apply(
-            lambda row: f"{row.Indicator.strip()}, {row.Unit.strip()}", axis=1
+        mask = ~df["Subgroup"].str.startswith("Category")
+        # only keep indicators with just one or 'Total' dimension, counting subgroups
+        # among the remaining rows so that both filters are applied in one go
+        subgroups = df["Subgroup"].where(mask)
+        n_subgroups = subgroups.groupby(df["Indicator"]).transform("nunique")
+        mask &= n_subgroups.eq(1) | df["Subgroup"].eq("Total")
+        df = df.loc[mask].copy()
+        df["indicator_name"] = (
+            df["Indicator"].str.strip() + ", " + df["Unit"].str.strip()
         )
         df = df.reindex(columns=columns).rename(columns=columns)
         # remove all duplicates
-        df.drop_duplicates(
+        df = df.drop_duplicates(
             subset=["indicator_name", "country_code", "year"],
             keep=False,
-            ignore_index=True,
-            inplace=True,
         )
         # remove rows without values
-        df.dropna(subset=["value"], inplace=True)
-        return df
+        return df.dropna(subset=["value"], ignore_index=True)
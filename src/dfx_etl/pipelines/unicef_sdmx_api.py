@@ -6,9 +6,10 @@ https://sdmx.data.unicef.org/overview.html.
 """
 
 import httpx
+import orjson
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 from pydantic import Field, HttpUrl
-from tqdm import tqdm
 
 from ..validation import PREFIX_DIMENSION
 from ._base import BaseRetriever, BaseTransformer
@@ -49,13 +50,11 @@ class Retriever(BaseRetriever):
         """
         df_metadata = self._get_metadata()
         fields = self._get_query_fields()
-        data = []
         with self.client as client:
-            for _, row in tqdm(df_metadata.iterrows(), total=len(df_metadata)):
-                df = self._get_data(row.code, fields, client=client, **kwargs)
-                if df is None:
-                    continue
-                data.append(df)
+            data = self.map_concurrently(
+                lambda code: self._get_data(code, fields, client=client, **kwargs),
+                df_metadata["code"],
+            )
         return pd.concat(data, axis=0, ignore_index=True)
 
     def _get_dataflow(self) -> dict:
@@ -70,7 +69,7 @@ class Retriever(BaseRetriever):
         }
         response = self.client.get(f"data/{self.dataflow}", params=params)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def _get_query_fields(self) -> list[str]:
         data = self._get_dataflow()
@@ -182,20 +181,23 @@ class Transformer(BaseTransformer):
             "OBS_VALUE": "value",
             "DATA_SOURCE": "source",
         }
-        # subset yearly data
-        df = df.loc[
-            df["TIME_PERIOD"].astype(str).str.strip().str.match(r"^\d{4}$")
-        ].copy()
+        # subset yearly data, matching on Arrow strings rather than Python objects
+        periods = df["TIME_PERIOD"].astype("string[pyarrow]").str.strip()
+        df = df.loc[periods.str.fullmatch(r"\d{4}").fillna(False)].copy()
         # handle values like <1 or <100 or >95%
         # the values now represent and upper/lower bound respectively
-        df["OBS_VALUE"] = df["OBS_VALUE"].apply(
-            lambda x: x.strip("<>") if isinstance(x, str) else x
-        )
-        df["OBS_VALUE"] = pd.to_numeric(df["OBS_VALUE"], errors="coerce")
-        df.dropna(subset=["OBS_VALUE"], inplace=True)
-        df["indicator_name"] = df.apply(
-            lambda row: f"{row['Indicator']}, {row['Unit of measure']} [{row['INDICATOR']}]",
-            axis=1,
+        values = df["OBS_VALUE"]
+        if not is_numeric_dtype(values):
+            values = values.astype("string[pyarrow]").str.strip("<>")
+        df["OBS_VALUE"] = pd.to_numeric(values, errors="coerce")
+        df = df.dropna(subset=["OBS_VALUE"])
+        df["indicator_name"] = (
+            df["Indicator"].astype(str)
+            + ", "
+            + df["Unit of measure"].astype(str)
+            + " ["
+            + df["INDICATOR"].astype(str)
+            + "]"
         )
         df["DATA_SOURCE"] = df["DATA_SOURCE"].combine_first(df["SOURCE_LINK"])
         return df.reindex(columns=columns).rename(columns=columns)
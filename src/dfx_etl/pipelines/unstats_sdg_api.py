@@ -4,9 +4,9 @@ See https://unstats.un.org/sdgs/UNSDGAPIV5/swagger/index.html.
 """
 
 import httpx
+import orjson
 import pandas as pd
 from pydantic import Field, HttpUrl
-from tqdm import tqdm
 
 from ..utils import replace_country_metadata, to_snake_case
 from ._base import BaseRetriever, BaseTransformer
@@ -40,13 +40,11 @@ class Retriever(BaseRetriever):
             Raw data from the API for the indicators with supported disaggregations.
         """
         df_metadata = self.get_metadata()
-        data = []
         with self.client as client:
-            for _, row in tqdm(df_metadata.iterrows(), total=len(df_metadata)):
-                df = self._get_data(row.code, client=client, **kwargs)
-                if df is None:
-                    continue
-                data.append(df)
+            data = self.map_concurrently(
+                lambda code: self._get_data(code, client=client, **kwargs),
+                df_metadata["code"],
+            )
         df_data = pd.concat(data, axis=0, ignore_index=True)
         return df_data
 
@@ -62,7 +60,7 @@ class Retriever(BaseRetriever):
         response = self.client.get("series/list", timeout=60)
         response.raise_for_status()
         columns = {"code": "code", "description": "name"}
-        df = pd.DataFrame(response.json())
+        df = pd.DataFrame(orjson.loads(response.content))
         return df.reindex(columns=columns).rename(columns=columns)
 
     def _get_data(
@@ -113,7 +111,6 @@ class Retriever(BaseRetriever):
             Data frame with country data in the wide format.
 
         """
-        data = []
         params = {
             "seriesCode": indicator_code,
             "pageSize": 1_000,
@@ -121,7 +118,7 @@ class Retriever(BaseRetriever):
         } | kwargs
         response = client.get("Series/Data", params=params)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         pages = data["totalPages"]
         df = pd.DataFrame(data["data"])
         return pages, df
@@ -156,16 +153,21 @@ class Transformer(BaseTransformer):
         df["alpha_3_code"] = replace_country_metadata(
             df["geoAreaCode"], "m49", "iso-alpha-3"
         )
-        df["value"] = df["value"].replace({"NaN": None})
-        df.dropna(subset=["alpha_3_code", "value"], ignore_index=True, inplace=True)
+        # Coerce values to numbers, turning sentinels like 'NaN' into missing values
+        df["value"] = pd.to_numeric(df["value"], errors="coerce")
+        df = df.dropna(subset=["alpha_3_code", "value"], ignore_index=True)
         for column, prefix in (("attributes", "prop"), ("dimensions", "disagr")):
             df = df.join(
                 pd.DataFrame(df[column].tolist())
                 .rename(lambda name: to_snake_case(name, prefix=prefix), axis=1)
                 .fillna("Total")  # Fill as 'Total' when no dimension exist
             )
-        df["indicator_name"] = df.apply(
-            lambda row: f"{row['seriesDescription']}, {row['prop_units']} [{row['series']}]",
-            axis=1,
+        df["indicator_name"] = (
+            df["seriesDescription"].astype(str)
+            + ", "
+            + df["prop_units"].astype(str)
+            + " ["
+            + df["series"].astype(str)
+            + "]"
         )
         return df.rename(columns=columns)
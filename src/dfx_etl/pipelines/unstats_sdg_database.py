@@ -10,8 +10,8 @@ import logging
 from pathlib import Path
 
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 from pydantic import Field
-from tqdm import tqdm
 
 from ..storage import BaseStorage
 from ..utils import replace_country_metadata, to_snake_case
@@ -52,11 +52,13 @@ class Retriever(BaseRetriever):
         pd.DataFrame
             Raw data frame with the data from the databae.
         """
-        data = []
-        # All 17 SDGs
-        for goal in tqdm(range(1, 18)):
-            df = storage.read_dataset(self.uri.joinpath(f"Goal{goal}.xlsx"), **kwargs)
-            data.append(df)
+        # Read the files for all 17 SDGs concurrently as they are independent
+        data = self.map_concurrently(
+            lambda goal: storage.read_dataset(
+                self.uri.joinpath(f"Goal{goal}.xlsx"), **kwargs
+            ),
+            range(1, 18),
+        )
         return pd.concat(data, axis=0, ignore_index=True)
 
 
@@ -111,18 +113,21 @@ class Transformer(BaseTransformer):
             for column in dimensions
         }
         df = df.reindex(columns=columns).rename(columns=columns)
-        df["indicator_name"] = df.apply(
-            lambda row: f"{row.indicator_name} [{row.indicator_code}]", axis=1
+        df["indicator_name"] = (
+            df["indicator_name"].astype(str)
+            + " ["
+            + df["indicator_code"].astype(str)
+            + "]"
         )
-        df.drop(columns=["indicator_code"], inplace=True)
+        df = df.drop(columns=["indicator_code"])
         df["country_code"] = replace_country_metadata(
             df["country_code"].astype(str), "m49", "iso-alpha-3"
         )
         # Handle values like '<2.5' or '>99' by keeping the numeric part only
-        df["value"] = pd.to_numeric(
-            df["value"].astype(str).str.lstrip("<|>"), errors="coerce"
-        )
-        df.dropna(subset=["value"], ignore_index=True, inplace=True)
+        values = df["value"]
+        if not is_numeric_dtype(values):
+            values = values.astype("string[pyarrow]").str.lstrip("<|>")
+        df["value"] = pd.to_numeric(values, errors="coerce")
+        df = df.dropna(subset=["value"])
         # Drop full duplicates since indicators may be repeated for several Goals
-        df.drop_duplicates(ignore_index=True, inplace=True)
-        return df
+        return df.drop_duplicates(ignore_index=True)
@@ -7,11 +7,11 @@ See https://www.who.int/data/gho/info/gho-odata-api.
 import warnings
 
 import httpx
+import orjson
 import pandas as pd
 from pydantic import Field, HttpUrl
-from tqdm import tqdm
 
-from ..utils import _resolve_dimensions, to_snake_case
+from ..utils import to_snake_case
 from ._base import BaseRetriever, BaseTransformer
 
 __all__ = ["Retriever", "Transformer"]
@@ -51,14 +51,17 @@ class Retriever(BaseRetriever):
             Raw data from the API for the indicators with supported disaggregations.
         """
         df_metadata = self.get_metadata()
-        data = []
         with self.client as client:
-            for _, row in tqdm(df_metadata.iterrows(), total=len(df_metadata)):
-                df = self._get_data(row.code, client=client, **kwargs)
-                if df is None:
-                    continue
-                df["indicator_name"] = f"{row['name']} [{row['code']}]"
-                data.append(df)
+            dfs = self.map_concurrently(
+                lambda code: self._get_data(code, client=client, **kwargs),
+                df_metadata["code"],
+            )
+        data = []
+        for row, df in zip(df_metadata.itertuples(index=False), dfs):
+            if df is None:
+                continue
+            df["indicator_name"] = f"{row.name} [{row.code}]"
+            data.append(df)
         return pd.concat(data, axis=0, ignore_index=True)
 
     def _get_dimensions(self) -> dict:
@@ -72,7 +75,7 @@ class Retriever(BaseRetriever):
         """
         response = self.client.get("DIMENSION")
         response.raise_for_status()
-        return response.json()["value"]
+        return orjson.loads(response.content)["value"]
 
     def _get_metadata(self) -> pd.DataFrame:
         """
@@ -85,7 +88,7 @@ class Retriever(BaseRetriever):
         """
         response = self.client.get("Indicator")
         response.raise_for_status()
-        df = pd.DataFrame(response.json()["value"])
+        df = pd.DataFrame(orjson.loads(response.content)["value"])
         columns = {"IndicatorCode": "code", "IndicatorName": "name"}
         return df.reindex(columns=columns).rename(columns=columns)
 
@@ -122,7 +125,20 @@ class Retriever(BaseRetriever):
         filters = f"?$filter={' and '.join(filters)}" if filters else ""
         response = client.get(f"{indicator_code}{filters}")
         response.raise_for_status()
-        return pd.DataFrame(response.json()["value"])
+        # Only pick the fields used by the transformer while building the data frame
+        columns = [
+            "SpatialDim",
+            "TimeDim",
+            "Dim1Type",
+            "Dim1",
+            "Dim2Type",
+            "Dim2",
+            "Dim3Type",
+            "Dim3",
+            "DataSourceDim",
+            "NumericValue",
+        ]
+        return pd.DataFrame(orjson.loads(response.content)["value"], columns=columns)
 
 
 class Transformer(BaseTransformer):
@@ -161,31 +177,33 @@ class Transformer(BaseTransformer):
         # Handle dimensions stored in the long format but avoid adding new columns for each
         dims = df.filter(regex=r"^Dim\d$").columns
         df["DataSourceDim"] = df["DataSourceDim"].str.replace("DATASOURCE_", "")
-        df["dimension"] = (
-            df.apply(
-                lambda row: (
-                    {
-                        to_snake_case(category): row[dim].replace(f"{category}_", "")
-                        for dim in dims
-                        if (category := row[f"{dim}Type"]) is not None
-                    }
-                    # Add source as a dimensions to avoid duplicates
-                    | {"source": row["DataSourceDim"]}
-                )
-                or None,
-                axis=1,
+        # Resolve dimensions one column at a time rather than one row at a time, as
+        # in `_combine_dimensions`, prefixing totals with dimension names
+        parts = []
+        for dim in dims:
+            categories = df[f"{dim}Type"]
+            values = df[dim].where(categories.notna())
+            for category in categories.dropna().unique():
+                mask = categories.eq(category)
+                values.loc[mask] = values.loc[mask].str.replace(f"{category}_", "")
+            names = categories.map(
+                lambda x: to_snake_case(x).replace("_", " "), na_action="ignore"
             )
-            .map(lambda x: _resolve_dimensions(x, prefix=""), na_action="ignore")
-            .fillna("Total")
-        )
-        df = df.reindex(columns=columns).rename(columns=columns).reset_index(drop=True)
-        # Drop duplicates deterministically
-        columns = set(df.columns) - {"value"}
-        df.sort_values(list(columns), ignore_index=True, inplace=True)
-        df.drop_duplicates(
-            subset=list(columns - {"source"}),
+            parts.append(values.mask(values.str.lower().eq("total"), "All " + names))
+        # Add source as a dimensions to avoid duplicates
+        values = df["DataSourceDim"]
+        parts.append(values.mask(values.str.lower().eq("total"), "All source"))
+        dimension = pd.Series("", index=df.index, dtype=object)
+        for part in parts:
+            dimension += ("; " + part).fillna("")
+        df["dimension"] = dimension.str[2:].replace({"": "Total"})
+        df = df.reindex(columns=columns).rename(columns=columns)
+        # Drop duplicates deterministically, keeping the first source alphabetically.
+        # Duplicates only differ in source and value, so a stable sort on the source
+        # alone picks the same rows as sorting on every column
+        df = df.sort_values("source", kind="stable")
+        return df.drop_duplicates(
+            subset=list(set(df.columns) - {"value", "source"}),
             keep="first",
             ignore_index=True,
-            inplace=True,
         )
-        return df
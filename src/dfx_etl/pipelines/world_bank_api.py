@@ -7,12 +7,13 @@ See https://datahelpdesk.worldbank.org/knowledgebase/topics/125589-developer-inf
 import logging
 import traceback
 
-import country_converter as coco
 import httpx
+import orjson
 import pandas as pd
 from pydantic import Field, HttpUrl
 from tqdm import tqdm
 
+from ..utils import convert_country_names
 from ._base import BaseRetriever, BaseTransformer
 
 __all__ = ["Retriever", "Transformer"]
@@ -53,30 +54,16 @@ class Retriever(BaseRetriever):
         if indicator_codes is None:
             df_metadata = self._get_metadata()
             indicator_codes = df_metadata["code"].tolist()
-        data = []
         with self.client as client:
-            for indicator_code in tqdm(indicator_codes):
-                try:
-                    page = 1
-                    while True:
-                        metadata, records = self._get_data(
-                            indicator_code, page, client, **kwargs
-                        )
-                        if metadata is None:
-                            break
-                        if records is not None:
-                            data.extend(records)
-                        if metadata["page"] == metadata["pages"]:
-                            break
-                        page += 1
-                except Exception as error:
-                    logger.error(
-                        "Indicator %s failed with: %s\n%s",
-                        indicator_code,
-                        error,
-                        traceback.format_exc(),
-                    )
-        return pd.DataFrame(data)
+            data = self.map_concurrently(
+                lambda code: self._get_pages(code, client=client, **kwargs),
+                indicator_codes,
+            )
+        # Skip indicators without data, which may leave nothing to concatenate
+        data = [df for df in data if df is not None]
+        if not data:
+            return pd.DataFrame()
+        return pd.concat(data, axis=0, ignore_index=True)
 
     def _get_metadata(self) -> pd.DataFrame:
         """
@@ -90,7 +77,7 @@ class Retriever(BaseRetriever):
                 while True:
                     response = client.get("indicator", params=params)
                     response.raise_for_status()
-                    metadata, indicators = response.json()
+                    metadata, indicators = orjson.loads(response.content)
                     data.extend(indicators)
                     pbar.update(round(total / metadata["pages"], 1))
                     if metadata["page"] == metadata["pages"]:
@@ -102,6 +89,55 @@ class Retriever(BaseRetriever):
         df = pd.DataFrame(data)
         return df.reindex(columns=columns).rename(columns=columns).drop_duplicates()
 
+    def _get_pages(
+        self,
+        indicator_code: str,
+        client: httpx.Client | None = None,
+        **kwargs,
+    ) -> pd.DataFrame | None:
+        """
+        Get all pages of series data for a single indicator.
+
+        Errors are logged rather than raised so that one failing indicator does not
+        abort the retrieval of the others.
+
+        Parameters
+        ----------
+        indicator_code : str
+            Indicator code. See `_get_metadata`.
+        client : httpx.Client, optional
+            Client to make requests with.
+        **kwargs
+            Extra arguments to pass to `_get_data`.
+
+        Returns
+        -------
+        pd.DataFrame or None
+            Data frame with raw records or None if no data is available.
+        """
+        data = []
+        try:
+            page = 1
+            while True:
+                metadata, records = self._get_data(
+                    indicator_code, page, client, **kwargs
+                )
+                if metadata is None:
+                    break
+                if records is not None:
+                    data.extend(records)
+                if metadata["page"] == metadata["pages"]:
+                    break
+                page += 1
+        except Exception as error:
+            logger.error(
+                "Indicator %s failed with: %s\n%s",
+                indicator_code,
+                error,
+                traceback.format_exc(),
+            )
+        return pd.DataFrame(data) if data else None
+
     def _get_data(
         self,
         indicator_code: str,
@@ -133,7 +169,7 @@ class Retriever(BaseRetriever):
             },
         )
         response.raise_for_status()
-        if len(data := response.json()) == 1:
+        if len(data := orjson.loads(response.content)) == 1:
             metadata = data[0]
             if "message" in metadata:
                 logging.warning(
@@ -164,32 +200,34 @@ class Transformer(BaseTransformer):
         pd.DataFrame
             Transformed data frame in the canonical format.
         """
-
-        df = df.copy()
-        for column in ("indicator", "country"):
-            df = df.join(
-                pd.DataFrame(df[column].tolist()).rename(
-                    lambda x: f"{column}_{x}", axis=1
-                )
-            )
-            df.drop(column, axis=1, inplace=True)
-        df.replace({"": None}, inplace=True)
-        cc = coco.CountryConverter()
-        df["country_value"] = cc.pandas_convert(
-            df["country_value"], to="ISO3", not_found=None
+        # Expand nested records and attach them in a single concatenation rather than
+        # rebuilding the frame with a join and a drop for each column
+        columns = ["indicator", "country"]
+        expanded = [
+            pd.DataFrame(df[column].tolist(), index=df.index).add_prefix(f"{column}_")
+            for column in columns
+        ]
+        df = pd.concat([df.drop(columns=columns), *expanded], axis=1)
+        df["country_value"] = convert_country_names(df["country_value"])
+
+        # Coalesce country codes in one row-wise pass instead of repeated alignment,
+        # treating empty codes as missing, e.g., for aggregates
+        columns = ["countryiso3code", "country_id", "country_value"]
+        df["countryiso3code"] = df[columns].replace({"": None}).bfill(axis=1).iloc[:, 0]
+
+        # keep only yearly data with country codes and values in a single selection
+        mask = (
+            df["countryiso3code"].notna()
+            & df["date"].str.isdigit()
+            & df["value"].notna()
         )
+        df = df.loc[mask].copy()
 
-        for column in ("country_id", "country_value"):
-            df["countryiso3code"] = df["countryiso3code"].combine_first(df[column])
-        df.dropna(subset=["countryiso3code"], inplace=True)
-
-        # keep only yearly data
-        df = df.loc[df["date"].str.isdigit()].copy()
-
-        df.dropna(subset=["value"], inplace=True)
-
-        df["indicator_name"] = df.apply(
-            lambda row: f"{row['indicator_value']} [{row['indicator_id']}]", axis=1
+        df["indicator_name"] = (
+            df["indicator_value"].astype(str)
+            + " ["
+            + df["indicator_id"].astype(str)
+            + "]"
         )
         columns = {
             "indicator_name": "indicator_name",
@@ -76,16 +76,31 @@ class Transformer(BaseTransformer):
             Transformed data frame in the canonical format.
         """
         columns = {
-            "Country Name": "country_name",
             "Country Code": "country_code",
-            "Indicator Name": "indicator_name",
-            "Indicator Code": "indicator_code",
+            "indicator_name": "indicator_name",
         }
-        df = df.melt(id_vars=list(columns), var_name="year", value_name="value")
-        df["year"] = df["year"].astype(int)
-        df = df.query("year >= 2015").dropna(subset=["value"])
-        df.rename(columns=columns, inplace=True)
-        df["indicator_name"] = df.apply(
-            lambda row: f"{row.indicator_name} [{row.indicator_code}]", axis=1
+        # Build indicator names once per wide row instead of once per melted row
+        df["indicator_name"] = (
+            df["Indicator Name"].astype(str)
+            + " ["
+            + df["Indicator Code"].astype(str)
+            + "]"
         )
-        return df
+        # Repeat identifiers as category codes rather than strings when melting, they
+        # are coerced back to strings by the validation schema
+        df[list(columns)] = df[list(columns)].astype("category")
+        # Cast year labels once instead of parsing a string in every melted row and
+        # only melt recent years rather than filtering them out after reshaping
+        years = {
+            column: int(column)
+            for column in df.columns
+            if column.isdigit() and int(column) >= 2015
+        }
+        df = df.rename(columns=years).melt(
+            id_vars=list(columns),
+            value_vars=list(years.values()),
+            var_name="year",
+            value_name="value",
+        )
+        df["year"] = df["year"].astype("int64")
+        return df.dropna(subset=["value"]).rename(columns=columns)
@@ -40,6 +40,11 @@ class PipelineSettings(BaseModel):
     http_timeout: int = Field(
         default=30, description="Default client timeout in seconds for HTTP requests."
     )
+    max_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of threads used to retrieve data from a source concurrently.",
+    )
     year_min: int = Field(
         default=2005,
         description="Minimum year value to be used as a cut-off point for the data. Observations "
@@ -9,6 +9,8 @@ from typing import Any, final
 
 import pandas as pd
 
+from ..utils import _read_csv
+
 __all__ = ["BaseStorage"]
 
 
@@ -52,7 +54,7 @@ class BaseStorage(ABC):
         ----------
         df : pd.DataFrame
             Dataset to be written. The data frame must contain
-            a `name` attribute.
+            a `name` key in its `attrs`.
         folder_path : str, optional
             Path within the container or bucket to write the file to.
 
@@ -61,9 +63,9 @@ class BaseStorage(ABC):
         str
             Full path to the file in the storage.
         """
-        if getattr(df, "name") is None:
+        if (name := df.attrs.get("name")) is None:
             raise AttributeError("Data frame name must be provided.")
-        file_path = os.path.join(self.version, folder_path, f"{df.name}.parquet")
+        file_path = os.path.join(self.version, folder_path, f"{name}.parquet")
         file_path = self.join_path(file_path)
         df.to_parquet(file_path, storage_options=self.storage_options, index=False)
         return str(file_path)
@@ -95,13 +97,16 @@ class BaseStorage(ABC):
                     file_path, storage_options=self.storage_options, **kwargs
                 )
             case ".csv":
-                return pd.read_csv(
-                    file_path,
-                    storage_options=self.storage_options,
-                    low_memory=False,
-                    **kwargs,
+                # Parse with the multi-threaded Arrow reader where possible, falling
+                # back to the C engine for multi-line values, into Arrow-backed columns
+                kwargs = {"dtype_backend": "pyarrow"} | kwargs
+                return _read_csv(
+                    file_path, storage_options=self.storage_options, **kwargs
                 )
             case ".xlsx":
+                # calamine parses workbooks much faster than the default openpyxl,
+                # and Arrow-backed columns make string operations vectorised
+                kwargs = {"engine": "calamine", "dtype_backend": "pyarrow"} | kwargs
                 return pd.read_excel(
                     file_path, storage_options=self.storage_options, **kwargs
                 )
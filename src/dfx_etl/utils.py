@@ -4,11 +4,15 @@ performing minor data munging routines.
 """
 
 import re
+from functools import cache
 from importlib import resources
 from io import StringIO
 from typing import Literal, Sequence, TypeAlias
 
+import country_converter as coco
+import numpy as np
 import pandas as pd
+from pandas.errors import ParserError
 
 from . import data
 
@@ -16,14 +20,18 @@ __all__ = [
     "read_data_text",
     "read_data_binary",
     "read_data_csv",
+    "_read_csv",
     "get_country_metadata",
     "replace_country_metadata",
+    "convert_country_names",
     "to_snake_case",
     "_combine_dimensions",
 ]
 
 CountryField: TypeAlias = Literal["name", "m49", "iso-alpha-2", "iso-alpha-3"]
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 def read_data_text(file_name: str) -> str:
     """
@@ -81,6 +89,37 @@ def read_data_csv(file_name: str, **kwargs) -> pd.DataFrame:
     return pd.read_csv(StringIO(content), **kwargs)
 
 
+def _read_csv(source, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV file with the PyArrow engine, falling back to the C engine.
+
+    The multithreaded PyArrow engine cannot parse quoted values spanning multiple
+    lines when called through `pandas`, which is common for free-text fields in bulk
+    exports. Such files are re-read with the C engine instead.
+
+    Parameters
+    ----------
+    source : str or file-like object
+        Path, URL or buffer to read from. Buffers are rewound before re-reading.
+    **kwargs
+        Extra arguments to pass to `pd.read_csv`. No fallback is attempted when
+        `engine` is provided.
+
+    Returns
+    -------
+    pd.DataFrame
+        Pandas data frame with the contents of the CSV file.
+    """
+    if "engine" in kwargs:
+        return pd.read_csv(source, **kwargs)
+    try:
+        return pd.read_csv(source, engine="pyarrow", **kwargs)
+    except ParserError:
+        if hasattr(source, "seek"):
+            source.seek(0)
+        return pd.read_csv(source, low_memory=False, **kwargs)
+
+
 def get_country_metadata(
     field: CountryField = "iso-alpha-3", sort: bool = True
 ) -> list[str]:
@@ -106,9 +145,7 @@ def get_country_metadata(
         "iso-alpha-3": "ISO-alpha3 Code",
     }
     column = mapping[field]
-    # Avoid reading Namibia's ISO code ('NA') as NaN
-    df = read_data_csv("unsd-m49.csv", sep=";", keep_default_na=False)
-    values = df[column].astype("str").tolist()
+    values = _read_country_metadata()[column].astype("str").tolist()
     if sort:
         values.sort()
     return values
@@ -146,13 +183,88 @@ def replace_country_metadata(
 
     The values are case-sensitive. Any non-matching value is replaced with None.
     """
-    mapping = dict(
+    mapping = _get_country_mapping(source, target)
+    # Look up each unique value once, with the sentinel code -1 for missing values
+    # picking the trailing None
+    codes, uniques = pd.factorize(pd.Series(values))
+    targets = np.array([mapping.get(value) for value in uniques] + [None], dtype=object)
+    return targets[codes].tolist()
+
+
+def convert_country_names(names: pd.Series, to: str = "ISO3") -> pd.Series:
+    """
+    Convert free-form country names to codes using `country_converter`.
+
+    Parameters
+    ----------
+    names : pd.Series
+        Series of country names, possibly with spelling variations.
+    to : str, default='ISO3'
+        Target classification supported by `country_converter`.
+
+    Returns
+    -------
+    pd.Series
+        Series of converted codes. Any non-matching value is replaced with None.
+    """
+    cc = _get_country_converter()
+    codes = cc.pandas_convert(names, to=to, not_found="not found")
+    return codes.replace({"not found": None})
+
+
+@cache
+def _get_country_converter() -> coco.CountryConverter:
+    """
+    Get a country converter shared across calls.
+
+    Creating a converter loads and parses the classification data shipped with
+    `country_converter`, so the instance is built once and reused.
+
+    Returns
+    -------
+    coco.CountryConverter
+        Country converter instance.
+    """
+    return coco.CountryConverter()
+
+
+@cache
+def _read_country_metadata() -> pd.DataFrame:
+    """
+    Read UNSD M49 country metadata once and reuse it across calls.
+
+    Returns
+    -------
+    pd.DataFrame
+        Data frame with country metadata. It must not be modified in place.
+    """
+    # Avoid reading Namibia's ISO code ('NA') as NaN
+    return read_data_csv("unsd-m49.csv", sep=";", keep_default_na=False)
+
+
+@cache
+def _get_country_mapping(source: CountryField, target: CountryField) -> dict[str, str]:
+    """
+    Get a cached mapping from one country metadata field to another.
+
+    Parameters
+    ----------
+    source : CountryField
+        Name of the field to map from.
+    target : CountryField
+        Name of the field to map to.
+
+    Returns
+    -------
+    dict[str, str]
+        Mapping of source values to target values. It must not be modified in place.
+    """
+    return dict(
         zip(
             get_country_metadata(source, sort=False),
             get_country_metadata(target, sort=False),
         )
     )
-    return [mapping.get(value) for value in values]
 
 
 def to_snake_case(value: str, prefix: str = "", suffix: str = "") -> str:
@@ -180,7 +292,7 @@ def to_snake_case(value: str, prefix: str = "", suffix: str = "") -> str:
     >>> to_snake_case(" Time\n\n\nPeriod  ", prefix="dim", suffix="years")
     'dim_time_period_years'
     """
-    value = re.sub(r"\s+", "_", value.strip().lower())
+    value = _WHITESPACE_PATTERN.sub("_", value.strip().lower())
     if prefix:
         value = f"{prefix}_{value}"
     if suffix:
@@ -188,41 +300,13 @@ def to_snake_case(value: str, prefix: str = "", suffix: str = "") -> str:
     return value
 
 
-def _resolve_dimensions(mapping: pd.Series | dict, prefix: str) -> str:
-    """
-    Combine dimensions into a single value.
-
-    Parameters
-    ----------
-    mapping : pd.Series or dict
-        Series or dictionary with dimension values as values and fields as indexes or keys.
-    prefix : str
-        Prefix used for dimension fields to be removed.
-
-    Returns
-    -------
-    str
-        A single dimension value.
-    """
-    mapping = {
-        name.replace(prefix, "", 1).replace("_", " "): value
-        for name, value in mapping.items()
-        if not pd.isna(value)
-    }
-    values = [
-        value if value.lower() != "total" else f"All {name}"
-        for name, value in mapping.items()
-    ]
-    if not values:
-        return "Total"
-    return "; ".join(values)
-
-
 def _combine_dimensions(df: pd.DataFrame, prefix: str) -> pd.DataFrame:
     """
     Combine dimension columns into a single column.
 
-    This function is used as a parser during validation.
+    This function is used as a parser during validation. Non-missing dimension values
+    are joined with '; ' in column order, 'total' values are replaced with 'All <name>'
+    and rows without any dimension values are set to 'Total'.
 
     Parameters
     ----------
@@ -241,8 +325,15 @@ def _combine_dimensions(df: pd.DataFrame, prefix: str) -> pd.DataFrame:
     columns = [column for column in df.columns if column.startswith(prefix)]
     if not columns:
         return df.assign(dimension="Total")
-    return df.assign(
-        dimension=df[columns].apply(
-            lambda row: _resolve_dimensions(row, prefix), axis=1
+    # Resolve dimensions one column at a time rather than one row at a time
+    dimension = pd.Series("", index=df.index, dtype="string")
+    for column in columns:
+        name = column.replace(prefix, "", 1).replace("_", " ")
+        values = df[column].astype("string")
+        values = values.mask(
+            values.str.lower().eq("total").fillna(False), f"All {name}"
         )
-    )
+        dimension += ("; " + values).fillna("")
+    # Rows without any dimension values are totals
+    present = df[columns].notna().any(axis=1)
+    return df.assign(dimension=dimension.str[2:].where(present, "Total"))
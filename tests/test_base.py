@@ -0,0 +1,28 @@
+"""
+Tests for the base classes of the pipelines.
+"""
+
+import httpx
+import pytest
+
+from dfx_etl.pipelines.world_bank_api import Retriever
+
+
+@pytest.fixture
+def content() -> bytes:
+    """
+    CSV content large enough to span several parser blocks, with multi-line cells.
+    """
+    rows = (f'{i},"Footnote\nspanning lines {i}",{i / 2}\n' for i in range(50_000))
+    return ("OBS_VALUE,OBS_FOOTNOTE,UNIT_MULTIPLIER\n" + "".join(rows)).encode()
+
+
+def test_read_csv_with_multiline_values(content):
+    client = httpx.Client(
+        base_url="https://example.org/",
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, content=content)),
+    )
+    df = Retriever().read_csv("data", client=client)
+    assert df.shape == (50_000, 3)
+    assert df["OBS_FOOTNOTE"].iloc[-1] == "Footnote\nspanning lines 49999"
+    assert str(df["OBS_VALUE"].dtype) == "int64[pyarrow]"
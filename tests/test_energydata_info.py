@@ -0,0 +1,25 @@
+"""
+Tests for the ENERGYDATA.INFO pipeline.
+"""
+
+import pandas as pd
+
+from dfx_etl.pipelines import energydata_info
+
+
+def test_transformer_does_not_fill_missing_values():
+    df = pd.DataFrame(
+        {
+            "Country/area": ["Kenya", None, None],
+            "Technology": ["Solar", None, "Wind"],
+            "Grid connection": ["On-grid", None, None],
+            "Year": [2020, 2021, 2020],
+            "Installed electricity capacity (MW)": [1.5, None, 3.0],
+        }
+    )
+    df = energydata_info.Transformer().transform(df)
+    # Merged label cells are filled but the gap in 2021 must not inherit a value
+    assert df[["year", "value"]].values.tolist() == [[2020, 1.5], [2020, 3.0]]
+    assert df["country_code"].eq("KEN").all()
+    assert df["dimension_energy_technology"].tolist() == ["Solar", "Wind"]
+    assert df["dimension_grid_connection"].tolist() == ["On-grid", "On-grid"]
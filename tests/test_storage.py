@@ -0,0 +1,27 @@
+"""
+Tests for the storage interfaces.
+"""
+
+import pytest
+
+from dfx_etl.settings import SETTINGS
+from dfx_etl.storage import LocalStorage
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path) -> LocalStorage:
+    """
+    Local storage in a temporary directory.
+    """
+    monkeypatch.setattr(SETTINGS, "local_storage", tmp_path)
+    return LocalStorage()
+
+
+def test_read_dataset_with_multiline_values(storage, tmp_path):
+    rows = (f'{i},"Indicator\nnote {i}",{i / 2}\n' for i in range(50_000))
+    content = "Series Code,Long definition,Value\n" + "".join(rows)
+    tmp_path.joinpath("WDISeries.csv").write_text(content)
+    df = storage.read_dataset("WDISeries.csv")
+    assert df.shape == (50_000, 3)
+    assert df["Long definition"].iloc[-1] == "Indicator\nnote 49999"
+    assert str(df["Value"].dtype) == "double[pyarrow]"
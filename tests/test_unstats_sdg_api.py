@@ -0,0 +1,26 @@
+"""
+Tests for the UN Stats SDG API pipeline.
+"""
+
+import pandas as pd
+
+from dfx_etl.pipelines import unstats_sdg_api
+
+
+def test_transformer_drops_non_numeric_values():
+    values = ["1.5", "NaN", "N/A", "<5", "2", 3]
+    df = pd.DataFrame(
+        {
+            "geoAreaCode": "404",
+            "timePeriodStart": range(2015, 2015 + len(values)),
+            "value": values,
+            "attributes": [{"Nature": "C", "Units": "PERCENT"}] * len(values),
+            "dimensions": [{"Sex": "FEMALE"}] * len(values),
+            "seriesDescription": "Proportion of population",
+            "series": "SI_POV_DAY1",
+        }
+    )
+    df = unstats_sdg_api.Transformer().transform(df)
+    assert df["year"].tolist() == [2015, 2019, 2020]
+    assert df["value"].tolist() == [1.5, 2.0, 3.0]
+    assert df["country_code"].eq("KEN").all()
@@ -0,0 +1,29 @@
+"""
+Tests for utility functions.
+"""
+
+import pandas as pd
+
+from dfx_etl.utils import _combine_dimensions
+
+
+def test_combine_dimensions():
+    df = pd.DataFrame(
+        {
+            "dimension_sex": ["Female", "Total", None, None],
+            "dimension_age_group": ["15-24", "15-24", "total", None],
+            "value": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    df = _combine_dimensions(df, "dimension_")
+    assert df["dimension"].tolist() == [
+        "Female; 15-24",
+        "All sex; 15-24",
+        "All age group",
+        "Total",
+    ]
+
+
+def test_combine_dimensions_without_dimension_columns():
+    df = _combine_dimensions(pd.DataFrame({"value": [1.0]}), "dimension_")
+    assert df["dimension"].tolist() == ["Total"]
@@ -0,0 +1,67 @@
+"""
+Tests for the WHO GHO API pipeline.
+"""
+
+import warnings
+
+import pandas as pd
+
+# The module warns about the deprecation of the API on import
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from dfx_etl.pipelines import who_gho_api
+
+
+def make_record(year, value, source=None, *dims) -> dict:
+    """
+    Make a raw GHO record with up to three dimensions given as (category, value).
+    """
+    record = {
+        "indicator_name": "Adolescent birth rate [MDG_0000000003]",
+        "SpatialDim": "KEN",
+        "TimeDim": year,
+        "DataSourceDim": None if source is None else f"DATASOURCE_{source}",
+        "NumericValue": value,
+    }
+    for i in range(1, 4):
+        category, code = dims[i - 1] if i <= len(dims) else (None, None)
+        record |= {f"Dim{i}Type": category, f"Dim{i}": code}
+    return record
+
+
+def test_transformer_resolves_dimensions_and_duplicates():
+    records = [
+        # the same categories in different dimension columns
+        make_record(2020, 1.0, "A", ("SEX", "SEX_MLE"), ("AGEGROUP", "AGEGROUP_Y15")),
+        make_record(2020, 2.0, "A", ("AGEGROUP", "AGEGROUP_Y15"), ("SEX", "SEX_MLE")),
+        make_record(
+            2021,
+            3.0,
+            "B",
+            ("AGEGROUP", "AGEGROUP_Y15"),
+            ("RESIDENCEAREATYPE", "RESIDENCEAREATYPE_URB"),
+            ("SEX", "SEX_FMLE"),
+        ),
+        make_record(2021, 4.0, None, ("SEX", "SEX_TOTAL")),
+        # the same observation from different sources is kept for each source
+        make_record(2022, 5.0, "B", ("SEX", "SEX_BTSX")),
+        make_record(2022, 6.0, "A", ("SEX", "SEX_BTSX")),
+        # exact duplicates only differing in value keep the first row
+        make_record(2023, 7.0, "A", ("SEX", "SEX_BTSX")),
+        make_record(2023, 8.0, "A", ("SEX", "SEX_BTSX")),
+        make_record(2024, 9.0),
+        make_record(2024, 10.0),
+    ]
+    df = who_gho_api.Transformer().transform(pd.DataFrame(records))
+    assert df.index.equals(pd.RangeIndex(len(df)))
+    df = df.sort_values(["year", "dimension"], ignore_index=True)
+    assert df[["year", "dimension", "source", "value"]].values.tolist() == [
+        [2020, "MLE; Y15; A", "A", 1.0],
+        [2020, "Y15; MLE; A", "A", 2.0],
+        [2021, "All sex", None, 4.0],
+        [2021, "Y15; URB; FMLE; B", "B", 3.0],
+        [2022, "BTSX; A", "A", 6.0],
+        [2022, "BTSX; B", "B", 5.0],
+        [2023, "BTSX; A", "A", 7.0],
+        [2024, "Total", None, 9.0],
+    ]
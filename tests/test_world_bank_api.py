@@ -0,0 +1,32 @@
+"""
+Tests for the World Bank Indicator API pipeline.
+"""
+
+import httpx
+import pandas as pd
+import pytest
+
+from dfx_etl.pipelines import world_bank_api
+
+
+@pytest.fixture
+def retriever(monkeypatch):
+    """
+    Retriever whose client responds to every request with no data.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[{"message": [{"key": "No data"}]}])
+
+    retriever = world_bank_api.Retriever()
+    client = httpx.Client(
+        base_url=str(retriever.uri), transport=httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(world_bank_api.Retriever, "client", property(lambda _: client))
+    return retriever
+
+
+def test_retriever_returns_empty_frame_without_data(retriever):
+    df = retriever(indicator_codes=["SP.POP.TOTL", "NY.GDP.MKTP.CD"])
+    assert isinstance(df, pd.DataFrame)
+    assert df.empty